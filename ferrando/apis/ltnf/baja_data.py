@@ -1,16 +1,38 @@
 import requests
 import json
-from typing import TypeAlias
+from typing import Iterator, TypeAlias
+
+try:
+    from .cache import cached_get
+    from .stream import iter_json_array
+except ImportError:
+    from cache import cached_get
+    from stream import iter_json_array
 
 RSession: TypeAlias = requests.Session
 
+# Tamaño de los trozos al leer respuestas en modo streaming
+STREAM_CHUNK_SIZE: int = 64 * 1024
+
+# TTL en segundos del caché de respuestas para los endpoints de metadata
+ASSET_PROVIDERS_TTL: int = 7 * 24 * 3600
+BANKS_TTL: int = 30 * 24 * 3600
+CONCEPTUAL_ASSETS_TTL: int = 24 * 3600
+
+def _stream_data(url: str, session: RSession) -> Iterator[dict]:
+    """
+    Decodes the data array of the response incrementally, without buffering the whole body
+    """
+    with session.get(url, stream=True) as r:
+        r.raise_for_status()
+        yield from iter_json_array(r.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+
 def asset_providers(session: RSession) -> json:
     """
     Retrieves all the asset providers
     """
     url = "https://fintual.cl/api/asset_providers"
-    r= session.get(url)
-    return r.json()
+    return cached_get(url, session, ttl=ASSET_PROVIDERS_TTL)
     
 def asset_providers_data(asset_provider_id: int, session: RSession) -> json:
     """
@@ -25,24 +47,21 @@ def banks(session:RSession) -> json:
     Retrieves filtered banks
     """
     url = f"https://fintual.cl/api/banks"
-    r= session.get(url)
-    return r.json()
+    return cached_get(url, session, ttl=BANKS_TTL)
 
 def conceptual_asset_by_provider(asset_provider_id: int, session: RSession) -> json:
     """
     Retrieves conceptual assets for the given provider
     """
     url = f"https://fintual.cl/api/asset_providers/{asset_provider_id}/conceptual_assets"
-    r= session.get(url)
-    return r.json()
+    return cached_get(url, session, ttl=CONCEPTUAL_ASSETS_TTL)
 
 def conceptual_assets(session: RSession) -> json:
     """
     Retrieves conceptual assets
     """
     url = f"https://fintual.cl/api/conceptual_assets"
-    r= session.get(url)
-    return r.json()
+    return cached_get(url, session, ttl=CONCEPTUAL_ASSETS_TTL)
 
 def conceptual_assets_data(conceptual_asset_id: int, session: RSession) -> json:
     """
@@ -76,6 +95,13 @@ def real_assets_days(real_asset_id: int, session: RSession) -> json:
     r= session.get(url)
     return r.json() 
 
+def real_assets_days_stream(real_asset_id: int, session: RSession) -> Iterator[dict]:
+    """
+    Streams specific real asset days, one record at a time
+    """
+    url = f"https://fintual.cl/api/real_assets/{real_asset_id}/days"
+    yield from _stream_data(url, session)
+
 def real_asset_specific_date(real_asset_id: int, date:str, session: RSession) -> json:
     """
     Retrieves specific real asset days
@@ -94,6 +120,14 @@ def real_asset_from_date(real_asset_id: int, from_date:str, session: RSession) -
     r= session.get(url)
     return r.json()
 
+def real_asset_from_date_stream(real_asset_id: int, from_date:str, session: RSession) -> Iterator[dict]:
+    """
+    Streams specific real asset days, one record at a time
+    date es %Y-%m-%d
+    """
+    url = f"https://fintual.cl/api/real_assets/{real_asset_id}/days?from_date={from_date}"
+    yield from _stream_data(url, session)
+
 def real_asset_to_date(real_asset_id: int, from_date:str, session: RSession) -> json:
     """
     Retrieves specific real asset days
@@ -0,0 +1,147 @@
+"""
+Caché de respuestas HTTP para la API de Fintual.
+
+Guarda en disco el cuerpo JSON de cada respuesta junto con su ETag y Last-Modified. Mientras la entrada
+esté dentro de su TTL se devuelve sin ir a la red; al vencer se revalida con If-None-Match/If-Modified-Since
+y, si el servidor responde 304, se reutiliza el cuerpo guardado sin descargarlo de nuevo.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from time import time
+
+import requests
+
+# Directorio por defecto del caché, se puede cambiar con la variable de entorno FERRANDO_CACHE_DIR
+cache_dir: Path = Path(
+    os.environ.get("FERRANDO_CACHE_DIR", Path.home() / ".cache" / "ferrando" / "ltnf")
+)
+
+# Contadores de uso del caché
+cache_stats: dict[str, int] = {"hits": 0, "misses": 0, "revalidated": 0, "stale": 0}
+
+
+def _entry_path(url: str) -> Path:
+    """
+    Ruta del archivo de caché para una url.
+    """
+    return cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+
+def _read_entry(url: str) -> dict | None:
+    """
+    Lee la entrada de caché de una url, o None si no existe o está corrupta.
+    """
+    try:
+        with open(_entry_path(url)) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if entry.get("url") == url else None
+
+
+def _write_entry(entry: dict) -> None:
+    """
+    Escribe una entrada de caché de forma atómica.
+    """
+    path = _entry_path(entry["url"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Archivo temporal con nombre único para que procesos concurrentes no se pisen
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, suffix=".tmp", delete=False
+    ) as f:
+        tmp_path = f.name
+        try:
+            json.dump(entry, f)
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    os.replace(tmp_path, path)
+
+
+def cached_get(url: str, session: requests.Session, ttl: float) -> json:
+    """
+    Hace un GET a la url devolviendo el JSON, pasando por el caché en disco.
+
+    Args:
+    - url (str): La url a consultar.
+    - session (requests.Session): La sesión con la que se hace la consulta.
+    - ttl (float): Segundos durante los cuales la respuesta guardada se usa sin consultar al servidor.
+
+    Returns:
+    - json: El cuerpo de la respuesta.
+
+    Raises:
+    - requests.RequestException: Si la consulta falla (error HTTP, conexión, timeout) y no hay una respuesta
+      guardada.
+    - ValueError: Si la respuesta no es JSON y no hay una respuesta guardada.
+
+    Las respuestas con error no se guardan en el caché; si la consulta falla y hay una entrada vencida se
+    devuelve esa y se cuenta en cache_stats["stale"].
+    """
+    entry = _read_entry(url)
+    now = time()
+    if entry is not None and now - entry["fetched_at"] < ttl:
+        cache_stats["hits"] += 1
+        return entry["body"]
+
+    # Revalidación condicional si el servidor entregó ETag o Last-Modified
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        r = session.get(url, headers=headers)
+    except requests.RequestException:
+        # Sin conexión se sigue usando la respuesta guardada, aunque esté vencida
+        if entry is None:
+            raise
+        cache_stats["stale"] += 1
+        return entry["body"]
+    if entry is not None and r.status_code == 304:
+        cache_stats["revalidated"] += 1
+        entry["fetched_at"] = now
+        _write_entry(entry)
+        return entry["body"]
+
+    if r.ok:
+        try:
+            body = r.json()
+        except ValueError:
+            if entry is None:
+                raise
+        else:
+            cache_stats["misses"] += 1
+            _write_entry(
+                {
+                    "url": url,
+                    "fetched_at": now,
+                    "etag": r.headers.get("ETag"),
+                    "last_modified": r.headers.get("Last-Modified"),
+                    "body": body,
+                }
+            )
+            return body
+
+    # Si el servidor falla o responde algo que no es JSON se sigue usando la respuesta guardada
+    if entry is not None:
+        cache_stats["stale"] += 1
+        return entry["body"]
+    r.raise_for_status()
+
+
+def clear_cache() -> None:
+    """
+    Borra todas las entradas del caché en disco y reinicia los contadores.
+    """
+    if cache_dir.exists():
+        for path in cache_dir.glob("*.json"):
+            path.unlink()
+    for key in cache_stats:
+        cache_stats[key] = 0
@@ -0,0 +1,300 @@
+"""
+Carga de los datos de la API de Fintual a una base de datos relacional usando SQLAlchemy.
+
+Define un esquema con proveedores, activos conceptuales, activos reales y valores diarios, y funciones que
+reciben las respuestas de baja_data.py (o los registros de las versiones streaming) y las escriben con
+upserts multi-fila: las filas se agrupan en trozos de tamaño configurable y cada trozo se ejecuta como un
+executemany dentro de su propia transacción.
+"""
+import json
+from datetime import date
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from sqlalchemy import (
+    Column,
+    Date,
+    Engine,
+    Float,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+# Cantidad de filas por executemany/transacción
+DEFAULT_CHUNK_SIZE: int = 10_000
+
+# Los String llevan largo porque MySQL/MariaDB no acepta VARCHAR sin largo
+
+metadata = MetaData()
+
+asset_providers_table = Table(
+    "asset_providers",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(255)),
+)
+
+conceptual_assets_table = Table(
+    "conceptual_assets",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("asset_provider_id", Integer, ForeignKey("asset_providers.id"), index=True),
+    Column("name", String(255)),
+    Column("symbol", String(255)),
+    Column("category", String(255)),
+    Column("currency", String(255)),
+    Column("max_scale", Integer),
+    Column("run", String(255)),
+    Column("data_source", String(1024)),
+)
+
+real_assets_table = Table(
+    "real_assets",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("conceptual_asset_id", Integer, ForeignKey("conceptual_assets.id"), index=True),
+    Column("name", String(255)),
+    Column("symbol", String(255)),
+    Column("serie", String(255)),
+    Column("start_date", Date),
+    Column("end_date", Date),
+)
+
+real_asset_days_table = Table(
+    "real_asset_days",
+    metadata,
+    Column("real_asset_id", Integer, ForeignKey("real_assets.id"), primary_key=True),
+    Column("date", Date, primary_key=True),
+    Column("price", Float),
+    Column("net_asset_value", Float),
+    Column("total_assets", Float),
+    Column("total_net_assets", Float),
+)
+
+
+def create_schema(engine: Engine) -> None:
+    """
+    Crea las tablas del esquema si no existen.
+    """
+    metadata.create_all(engine)
+
+
+def _records(response: json | Iterable[dict]) -> Iterable[dict]:
+    """
+    Acepta una respuesta completa de la API ({"data": [...]}) o un iterable de registros.
+    """
+    return response["data"] if isinstance(response, dict) else response
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """
+    Convierte una fecha %Y-%m-%d de la API a date.
+    """
+    return date.fromisoformat(value[:10]) if value else None
+
+
+def _upsert_statement(table: Table, dialect_name: str) -> Any:
+    """
+    Construye un INSERT que actualiza las filas existentes según la llave primaria, para el dialecto dado.
+
+    Raises:
+    NotImplementedError: Si el dialecto no tiene upsert soportado, para no perder la idempotencia de la carga.
+    """
+    primary_key = [column.name for column in table.primary_key]
+    if dialect_name in ("sqlite", "postgresql"):
+        dialect = sqlite if dialect_name == "sqlite" else postgresql
+        statement = dialect.insert(table)
+        updates = {
+            column.name: statement.excluded[column.name]
+            for column in table.columns
+            if column.name not in primary_key
+        }
+        return statement.on_conflict_do_update(index_elements=primary_key, set_=updates)
+    if dialect_name in ("mysql", "mariadb"):
+        statement = mysql.insert(table)
+        updates = {
+            column.name: statement.inserted[column.name]
+            for column in table.columns
+            if column.name not in primary_key
+        }
+        return statement.on_duplicate_key_update(**updates)
+    raise NotImplementedError(f"Upsert no soportado para el dialecto {dialect_name!r}")
+
+
+def _chunks(rows: Iterable[dict], chunk_size: int) -> Iterator[list[dict]]:
+    """
+    Agrupa las filas en listas de a lo más chunk_size elementos.
+    """
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def _load(
+    engine: Engine, table: Table, rows: Iterable[dict], chunk_size: int
+) -> int:
+    """
+    Escribe las filas en la tabla con upserts por trozos, un trozo por transacción. Si una llave primaria
+    se repite dentro de un trozo se escribe sólo su última fila.
+
+    Returns:
+    int: El número de filas escritas.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser mayor que 0")
+    statement = _upsert_statement(table, engine.dialect.name)
+    primary_key = [column.name for column in table.primary_key]
+    total = 0
+    for chunk in _chunks(rows, chunk_size):
+        # Un mismo upsert multi-fila no puede tocar dos veces la misma llave (PostgreSQL falla con
+        # "cannot affect row a second time"), así que dentro del trozo se deja la última fila de cada llave
+        unique_rows = list(
+            {tuple(row[name] for name in primary_key): row for row in chunk}.values()
+        )
+        with engine.begin() as connection:
+            connection.execute(statement, unique_rows)
+        total += len(unique_rows)
+    return total
+
+
+def _rows(
+    response: json | Iterable[dict], to_row: Callable[[dict, dict], dict]
+) -> Iterator[dict]:
+    """
+    Convierte los registros de la API a filas usando to_row(registro, atributos).
+    """
+    for record in _records(response):
+        yield to_row(record, record.get("attributes", {}))
+
+
+def load_asset_providers(
+    engine: Engine,
+    response: json | Iterable[dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Carga la respuesta de asset_providers en la tabla asset_providers.
+
+    Args:
+    - engine (Engine): El engine de la base de datos de destino.
+    - response (json | Iterable[dict]): La respuesta de la API o sus registros.
+    - chunk_size (int): Filas por transacción.
+
+    Returns:
+    - int: El número de filas escritas.
+    """
+    rows = _rows(
+        response,
+        lambda record, attributes: {
+            "id": int(record["id"]),
+            "name": attributes.get("name"),
+        },
+    )
+    return _load(engine, asset_providers_table, rows, chunk_size)
+
+
+def load_conceptual_assets(
+    engine: Engine,
+    response: json | Iterable[dict],
+    asset_provider_id: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Carga la respuesta de conceptual_assets o conceptual_asset_by_provider en la tabla conceptual_assets.
+
+    Args:
+    - engine (Engine): El engine de la base de datos de destino.
+    - response (json | Iterable[dict]): La respuesta de la API o sus registros.
+    - asset_provider_id (Optional[int]): El proveedor de los activos, si se conoce.
+    - chunk_size (int): Filas por transacción.
+
+    Returns:
+    - int: El número de filas escritas.
+    """
+    rows = _rows(
+        response,
+        lambda record, attributes: {
+            "id": int(record["id"]),
+            "asset_provider_id": attributes.get("asset_provider_id") or asset_provider_id,
+            "name": attributes.get("name"),
+            "symbol": attributes.get("symbol"),
+            "category": attributes.get("category"),
+            "currency": attributes.get("currency"),
+            "max_scale": attributes.get("max_scale"),
+            "run": attributes.get("run"),
+            "data_source": attributes.get("data_source"),
+        },
+    )
+    return _load(engine, conceptual_assets_table, rows, chunk_size)
+
+
+def load_real_assets(
+    engine: Engine,
+    response: json | Iterable[dict],
+    conceptual_asset_id: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Carga la respuesta de real_assets_by_conceptual en la tabla real_assets.
+
+    Args:
+    - engine (Engine): El engine de la base de datos de destino.
+    - response (json | Iterable[dict]): La respuesta de la API o sus registros.
+    - conceptual_asset_id (Optional[int]): El activo conceptual de los activos reales, si se conoce.
+    - chunk_size (int): Filas por transacción.
+
+    Returns:
+    - int: El número de filas escritas.
+    """
+    rows = _rows(
+        response,
+        lambda record, attributes: {
+            "id": int(record["id"]),
+            "conceptual_asset_id": attributes.get("conceptual_asset_id") or conceptual_asset_id,
+            "name": attributes.get("name"),
+            "symbol": attributes.get("symbol"),
+            "serie": attributes.get("serie"),
+            "start_date": _parse_date(attributes.get("start_date")),
+            "end_date": _parse_date(attributes.get("end_date")),
+        },
+    )
+    return _load(engine, real_assets_table, rows, chunk_size)
+
+
+def load_real_asset_days(
+    engine: Engine,
+    response: json | Iterable[dict],
+    real_asset_id: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Carga los valores diarios de un activo real en la tabla real_asset_days.
+
+    Acepta la respuesta de real_assets_days/real_asset_from_date o directamente los registros de
+    real_assets_days_stream, en cuyo caso la carga avanza a medida que llega la descarga.
+
+    Args:
+    - engine (Engine): El engine de la base de datos de destino.
+    - response (json | Iterable[dict]): La respuesta de la API o sus registros.
+    - real_asset_id (int): El activo real al que pertenecen los valores.
+    - chunk_size (int): Filas por transacción.
+
+    Returns:
+    - int: El número de filas escritas.
+    """
+    rows = _rows(
+        response,
+        lambda record, attributes: {
+            "real_asset_id": real_asset_id,
+            "date": _parse_date(attributes["date"]),
+            "price": attributes.get("price"),
+            "net_asset_value": attributes.get("net_asset_value"),
+            "total_assets": attributes.get("total_assets"),
+            "total_net_assets": attributes.get("total_net_assets"),
+        },
+    )
+    return _load(engine, real_asset_days_table, rows, chunk_size)
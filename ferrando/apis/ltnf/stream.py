@@ -0,0 +1,189 @@
+"""
+Decodificación incremental de respuestas JSON grandes de la API de Fintual.
+
+Las respuestas tienen la forma {"data": [...], ...}. En vez de cargar todo el documento con r.json(),
+se recorre el flujo de bytes y se decodifica un elemento del arreglo a la vez, así la memoria se mantiene
+acotada sin importar el largo de la historia y el procesamiento se solapa con la descarga.
+"""
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# Caracteres con los que puede continuar un número JSON
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str = "data") -> Iterator[Any]:
+    """
+    Recorre un documento JSON que llega en trozos y entrega uno a uno los elementos del arreglo `key`.
+
+    Args:
+    - chunks (Iterable[bytes]): Los trozos del documento, por ejemplo r.iter_content().
+    - key (str): La llave del objeto raíz que contiene el arreglo. Por defecto "data".
+
+    Returns:
+    - Iterator[Any]: Los elementos del arreglo, ya decodificados.
+
+    Raises:
+    - ValueError: Si el documento no es un objeto JSON, si está truncado, si `key` no es un arreglo o si
+      `key` aparece más de una vez.
+
+    Example:
+    >>> list(iter_json_array([b'{"data": [{"id": 1},', b' {"id": 2}]}']))
+    [{'id': 1}, {'id': 2}]
+    """
+    chunks = iter(chunks)
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read_more() -> bool:
+        """Agrega el siguiente trozo al buffer, descartando lo ya consumido. False si no queda nada."""
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            eof = True
+            chunk = b""
+        buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+        pos = 0
+        return True
+
+    def next_char() -> str:
+        """Salta los espacios y devuelve el siguiente carácter sin consumirlo, o "" al final del documento."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                return ""
+
+    def expect(chars: str) -> str:
+        """Consume el siguiente carácter, que debe ser uno de `chars`."""
+        nonlocal pos
+        char = next_char()
+        if not char or char not in chars:
+            raise ValueError(f"JSON inválido: se esperaba uno de {chars!r} y llegó {char!r}")
+        pos += 1
+        return char
+
+    def decode_value() -> Any:
+        """Decodifica el siguiente valor completo, leyendo más trozos si está cortado."""
+        nonlocal pos
+        next_char()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+                # Un número cortado por el fin del trozo ("1." + "5", "2e" + "10") se decodifica a medias,
+                # así que sólo se acepta si lo sigue un carácter que no puede ser parte del número
+                is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+                if (
+                    not is_number
+                    or eof
+                    or (end < len(buffer) and buffer[end] not in _NUMBER_CHARS)
+                ):
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError("JSON inválido o truncado")
+            read_more()
+
+    expect("{")
+    found = False
+    if next_char() == "}":
+        pos += 1
+    else:
+        while True:
+            name = decode_value()
+            if not isinstance(name, str):
+                raise ValueError(f"JSON inválido: la llave {name!r} no es un string")
+            expect(":")
+            if name == key:
+                # r.json() se quedaría con la última aparición, así que una llave repetida es un error
+                if found:
+                    raise ValueError(f"La respuesta repite la llave {key!r}")
+                found = True
+                expect("[")
+                if next_char() == "]":
+                    pos += 1
+                else:
+                    while True:
+                        yield decode_value()
+                        if expect(",]") == "]":
+                            break
+            else:
+                decode_value()
+            if expect(",}") == "}":
+                break
+    # Se valida el resto del documento para detectar respuestas truncadas
+    if next_char():
+        raise ValueError("JSON inválido: hay contenido después del objeto raíz")
+    if not found:
+        raise ValueError(f"La respuesta no contiene la llave {key!r}")
+
+
+def records_to_columns(records: Iterable[dict]) -> dict[str, list]:
+    """
+    Convierte registros de la API a columnas, una lista por atributo más la columna "id".
+
+    Args:
+    - records (Iterable[dict]): Registros con la forma {"id": ..., "type": ..., "attributes": {...}}.
+
+    Returns:
+    - dict[str, list]: Las columnas, todas del mismo largo. Los atributos faltantes quedan como None.
+
+    Sirve para llenar un DataFrame directamente (pd.DataFrame(columns)) sin guardar los registros.
+    """
+    columns: dict[str, list] = {"id": []}
+    for n, record in enumerate(records):
+        row = {"id": record.get("id"), **record.get("attributes", {})}
+        for name in row.keys() - columns.keys():
+            columns[name] = [None] * n
+        for name, column in columns.items():
+            column.append(row.get(name))
+    return columns
+
+
+if __name__ == "__main__":
+    # Se corta cada documento en todos los tamaños de trozo posibles y se compara con json.loads
+    documents = [
+        {"data": [1.5, 2e10, 3, -4.25, True, None, "ñandú"]},
+        {"count": 12.5e-3, "data": [{"id": "1", "attributes": {"price": 1000.25}}], "next": None},
+        {"data": []},
+    ]
+    for document in documents:
+        raw = json.dumps(document, ensure_ascii=False).encode()
+        for size in range(1, len(raw) + 1):
+            pieces = [raw[i : i + size] for i in range(0, len(raw), size)]
+            assert list(iter_json_array(pieces)) == document["data"], (document, size)
+    print("OK: documentos válidos")
+
+    invalid = [
+        b'{"data": [{"a": 1}]',
+        b'{"data": [1, 2',
+        b'{"other": 1}',
+        b"{}",
+        b'{"data": [1]} x',
+        b"[1]",
+        b'{1: 2, "data": []}',
+        b'{"data": [1], "data": [2]}',
+    ]
+    for raw in invalid:
+        for size in range(1, len(raw) + 1):
+            pieces = [raw[i : i + size] for i in range(0, len(raw), size)]
+            try:
+                list(iter_json_array(pieces))
+            except ValueError:
+                continue
+            raise AssertionError(f"{raw!r} no falló con trozos de {size}")
+    print("OK: documentos inválidos")
+
+    print(records_to_columns(documents[1]["data"]))
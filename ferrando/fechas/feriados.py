@@ -7,6 +7,9 @@ El módulo define una clase, FinancialHolidays, que extiende la clase de feriado
 financieros adicionales. También configura objetos CustomBusinessDay para calcular rangos de días laborales
 que excluyen tanto feriados como fines de semana en ambos contextos financieros.
 
+Los calendarios parten cubriendo pocos años alrededor de la fecha actual y crecen bajo demanda: cuando una
+consulta toca un año aún no calculado, se calculan sus feriados, se agregan a las tablas y quedan en caché.
+
 Ejemplos de uso:
 - Generar un rango de fechas de días laborales en Chile que excluyan feriados y fines de semana.
 - Generar un rango de fechas de días laborales para la NYSE que excluyan sus feriados.
@@ -15,29 +18,24 @@ El módulo es útil para sincronizar actividades y proyecciones
 con días laborales reales en estos dos ámbitos geográficos y financieros.
 """
 from datetime import datetime, date
-from typing import Iterator, Optional
+from typing import Optional
 
 from holidays.countries import CL
-from holidays import NYSE
+from holidays import NYSE, HolidayBase
 import numpy as np
 import pandas as pd
 from pandas.tseries.offsets import CustomBusinessDay
 
-from generales import named_weekday
+try:
+    from .generales import named_weekday
+except ImportError:
+    from generales import named_weekday
 
 
-# Configuración inicial de fechas
-first_date: datetime = datetime(1990, 1, 1)  # Fecha inicial
-last_date: datetime = datetime(2050, 1, 1)  # Fecha final
-included_years: Iterator[int] = range(
-    first_date.year, last_date.year + 1
-)  # iterador de años
 current_date: datetime = datetime.now()  # Fecha actual
 
-# Verificación para asegurar cobertura de datos hasta al menos 3 años en el futuro
-if current_date.year + 3 > max(included_years):
-    print(f"OJO: SOLO HAY DATOS HASTA {max(included_years)}")
-    print("--> Modificar variable *last_date*")
+# Cobertura inicial de los calendarios, los demás años se calculan bajo demanda
+initial_years: range = range(current_date.year - 5, current_date.year + 4)
 
 
 class FinancialHolidays(CL):
@@ -54,12 +52,104 @@ class FinancialHolidays(CL):
         self[date(year, 12, 31)] = "Feriado bancario"  # Añade el feriado bancario
 
 
+# Proveedores de feriados para cada calendario y nombre de la variable del módulo que lo expone
+_holiday_providers: dict[str, type[HolidayBase]] = {
+    "chile": FinancialHolidays,
+    "nyse": NYSE,
+}
+_module_names: dict[str, str] = {
+    "chile": "chile_financial_days",
+    "nyse": "nyse_financial_days",
+}
+# Tablas de feriados ya calculados, por calendario y por año
+_holiday_tables: dict[str, dict[int, list[date]]] = {
+    key: {} for key in _holiday_providers
+}
+# Todos los CustomBusinessDay emitidos, por id, para reconocer calendarios antiguos
+_issued_calendars: dict[int, tuple[str, CustomBusinessDay]] = {}
+
+
+def _calendar_key(calendar: str | CustomBusinessDay) -> Optional[str]:
+    """
+    Obtiene la llave del calendario expandible asociado, o None si es un calendario externo.
+    """
+    if isinstance(calendar, str):
+        return calendar if calendar in _holiday_providers else None
+    issued = _issued_calendars.get(id(calendar))
+    if issued is not None and issued[1] is calendar:
+        return issued[0]
+    return None
+
+
+def _build_calendar(key: str) -> CustomBusinessDay:
+    """
+    Construye el CustomBusinessDay con todos los feriados calculados y actualiza la variable del módulo.
+    """
+    holidays = sorted(
+        {day for days in _holiday_tables[key].values() for day in days}
+    )
+    calendar = CustomBusinessDay(holidays=holidays)
+    _issued_calendars[id(calendar)] = (key, calendar)
+    globals()[_module_names[key]] = calendar
+    return calendar
+
+
+def extend_calendar(
+    calendar: str | CustomBusinessDay, first_year: int, last_year: int
+) -> CustomBusinessDay:
+    """
+    Asegura que el calendario tenga calculados los feriados entre dos años, ambos incluidos.
+
+    Sólo se calculan los años que faltan y la cobertura se mantiene continua, o sea, si se pide un año
+    lejano también se calculan los intermedios. Los calendarios externos (no creados por este módulo)
+    se devuelven sin cambios.
+
+    Args:
+    calendar (str | CustomBusinessDay): "chile", "nyse" o un calendario creado por este módulo.
+    first_year (int): Primer año que debe quedar cubierto.
+    last_year (int): Último año que debe quedar cubierto.
+
+    Returns:
+    CustomBusinessDay: El calendario vigente con la cobertura pedida.
+
+    Example:
+    >>> calendar = extend_calendar("chile", 2070, 2080)
+    >>> is_trading_day(datetime(2075, 12, 31), calendar)
+    False
+    """
+    key = _calendar_key(calendar)
+    if key is None:
+        return calendar
+    table = _holiday_tables[key]
+    requested = [first_year, last_year, *table]
+    years = range(min(requested), max(requested) + 1)
+    missing = [year for year in years if year not in table]
+    if not missing:
+        return globals()[_module_names[key]]
+    for year in missing:
+        table[year] = list(_holiday_providers[key](years=year).keys())
+    return _build_calendar(key)
+
+
+def _covering_calendar(
+    calendar: str | CustomBusinessDay, *dates: Optional[datetime | str | np.datetime64]
+) -> str | CustomBusinessDay:
+    """
+    Devuelve el calendario vigente que cubre los años de las fechas dadas, expandiéndolo si es necesario.
+    """
+    # Se normaliza con pd.Timestamp para aceptar todo lo que acepta pd.date_range (str, np.datetime64, ...)
+    years = [pd.Timestamp(d).year for d in dates if d is not None]
+    if not years or _calendar_key(calendar) is None:
+        return calendar
+    return extend_calendar(calendar, min(years), max(years))
+
+
 # Creación de objetos CustomBusinessDay para Chile y NYSE, esto es para pandas
-chile_financial_days: CustomBusinessDay = CustomBusinessDay(
-    holidays=FinancialHolidays(years=list(included_years))
+chile_financial_days: CustomBusinessDay = extend_calendar(
+    "chile", initial_years.start, initial_years.stop - 1
 )
-nyse_financial_days: CustomBusinessDay = CustomBusinessDay(
-    holidays=NYSE(years=list(included_years))
+nyse_financial_days: CustomBusinessDay = extend_calendar(
+    "nyse", initial_years.start, initial_years.stop - 1
 )
 
 
@@ -79,7 +169,8 @@ def is_trading_day(
     # Verificar si es fin de semana
     if input_date.weekday() > 4:  # 5 y 6 son sábado y domingo
         return False
-    # Verificar si es un feriado
+    # Verificar si es un feriado, calculando el año si aún no está cubierto
+    calendar = _covering_calendar(calendar, input_date)
     return not (np.datetime64(input_date) in calendar.holidays)
 
 
@@ -113,7 +204,14 @@ def add_trading_days(
             f"WARNING: {add_trading_days.__name__}: OJO QUE {input_date:%Y-%m-%d} PUEDE SER FERIADO"
         )
         return input_date
-    return (input_date + days * calendar).to_pydatetime()
+    # Se expande el calendario hasta que el resultado quede dentro de los años cubiertos
+    calendar = _covering_calendar(calendar, input_date)
+    while True:
+        result = (input_date + days * calendar).to_pydatetime()
+        covering = _covering_calendar(calendar, result)
+        if covering is calendar:
+            return result
+        calendar = covering
 
 
 def range_trading_days(
@@ -155,10 +253,18 @@ def range_trading_days(
         start, end = end, start  # Invertir start y end para manejar períodos negativos
         periods = abs(periods)  # Tomar el valor absoluto de los períodos
 
-    # Generación del rango de fechas
-    result = pd.date_range(
-        start=start, end=end, periods=periods, freq=freq, normalize=normalize
-    )
+    # Generación del rango de fechas, expandiendo el calendario hasta cubrir todo el rango
+    freq = _covering_calendar(freq, start, end)
+    while True:
+        result = pd.date_range(
+            start=start, end=end, periods=periods, freq=freq, normalize=normalize
+        )
+        if result.empty:
+            break
+        covering = _covering_calendar(freq, result[0], result[-1])
+        if covering is freq:
+            break
+        freq = covering
 
     # Como 'freq' puede ser un CustomBusinessDay que maneja feriados, el resultado ya debería considerar los días no comerciales.
     # Convierte el resultado a datetime y una lista
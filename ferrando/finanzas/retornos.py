@@ -0,0 +1,171 @@
+"""
+Analítica de series de precios de fondos alineadas a un calendario de trading.
+
+Todas las funciones trabajan sobre DataFrames anchos (índice de fechas, una columna por activo), de modo
+que los retornos, la volatilidad y los drawdowns de miles de activos se calculan de una vez como
+operaciones vectorizadas de pandas/NumPy, sin loops por activo ni por fecha.
+
+Ejemplo de uso con los fondos Focus:
+    >>> import requests
+    >>> from ferrando.apis.ltnf.baja_data import real_assets_days_stream
+    >>> with requests.Session() as session:
+    ...     records = {i: real_assets_days_stream(i, session) for i in (14900, 14901)}
+    ...     prices = align_to_calendar(prices_from_records(records))
+    >>> rolling_volatility(daily_returns(prices), window=20)
+"""
+from datetime import datetime
+from typing import Hashable, Iterable, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.offsets import CustomBusinessDay
+
+from ferrando.fechas.feriados import chile_financial_days, range_trading_days
+
+# Días de trading por año usados para anualizar
+TRADING_DAYS_PER_YEAR: int = 252
+
+
+def prices_from_records(
+    records_by_asset: Mapping[Hashable, Iterable[dict]], field: str = "price"
+) -> pd.DataFrame:
+    """
+    Construye un DataFrame ancho de precios a partir de los registros diarios de la API.
+
+    Args:
+    records_by_asset (Mapping[Hashable, Iterable[dict]]): Registros de real_assets_days (su "data") o de
+        real_assets_days_stream, por id de activo.
+    field (str): El atributo a usar como valor. Por defecto "price".
+
+    Returns:
+    pd.DataFrame: Índice de fechas ordenado y una columna por activo.
+    """
+    series = {}
+    for asset_id, records in records_by_asset.items():
+        dates, values = [], []
+        for record in records:
+            attributes = record["attributes"]
+            dates.append(attributes["date"])
+            values.append(attributes.get(field))
+        values = pd.Series(values, index=pd.to_datetime(dates), dtype="float64")
+        # Si la API repite una fecha se queda con el último valor
+        series[asset_id] = values[~values.index.duplicated(keep="last")]
+    return pd.DataFrame(series).sort_index()
+
+
+def align_to_calendar(
+    prices: pd.DataFrame,
+    calendar: CustomBusinessDay = chile_financial_days,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Reindexa los precios a los días de trading del calendario y rellena los huecos hacia adelante.
+
+    Args:
+    prices (pd.DataFrame): Precios con índice de fechas, una columna por activo.
+    calendar (CustomBusinessDay): El calendario de trading, por ejemplo chile_financial_days o nyse_financial_days.
+    start (Optional[datetime]): Inicio del rango. Por defecto la primera fecha de los precios.
+    end (Optional[datetime]): Fin del rango. Por defecto la última fecha de los precios.
+    limit (Optional[int]): Máximo de días de trading consecutivos a rellenar. Por defecto sin límite.
+
+    Returns:
+    pd.DataFrame: Los precios en los días de trading. Antes del primer precio de cada activo queda NaN.
+    """
+    if prices.empty:
+        return prices
+    start = prices.index[0] if start is None else start
+    end = prices.index[-1] if end is None else end
+    trading_days = pd.DatetimeIndex(range_trading_days(start=start, end=end, freq=calendar))
+    if trading_days.empty:
+        return prices.iloc[:0]
+    # Cada precio se asigna al primer día de trading desde su fecha, así los precios en días no hábiles
+    # (y los anteriores a start) se propagan sin contar como días rellenados
+    prices = prices.sort_index()
+    positions = trading_days.searchsorted(prices.index, side="left")
+    in_range = positions < len(trading_days)
+    collapsed = prices[in_range].groupby(trading_days[positions[in_range]]).last()
+    return collapsed.reindex(trading_days).ffill(limit=limit)
+
+
+def daily_returns(prices: pd.DataFrame, log: bool = False) -> pd.DataFrame:
+    """
+    Calcula los retornos diarios (simples o logarítmicos) de todos los activos.
+
+    Args:
+    prices (pd.DataFrame): Precios alineados al calendario.
+    log (bool): Si es True devuelve retornos logarítmicos.
+
+    Returns:
+    pd.DataFrame: Los retornos, la primera fila queda NaN.
+    """
+    if log:
+        return np.log(prices).diff()
+    return prices.pct_change(fill_method=None)
+
+
+def period_returns(prices: pd.DataFrame, freq: str = "ME") -> pd.DataFrame:
+    """
+    Calcula los retornos por período (mensual, anual, etc.) usando el último precio de cada período.
+
+    Args:
+    prices (pd.DataFrame): Precios alineados al calendario.
+    freq (str): Frecuencia de pandas del período, por ejemplo "ME" (mensual), "QE" o "YE".
+
+    Returns:
+    pd.DataFrame: Los retornos de cada período, indexados por el fin del período.
+    """
+    return prices.resample(freq).last().pct_change(fill_method=None)
+
+
+def rolling_volatility(
+    returns: pd.DataFrame,
+    window: int = 20,
+    annualization: Optional[int] = TRADING_DAYS_PER_YEAR,
+) -> pd.DataFrame:
+    """
+    Calcula la volatilidad móvil de los retornos.
+
+    Args:
+    returns (pd.DataFrame): Retornos diarios.
+    window (int): Tamaño de la ventana en días de trading.
+    annualization (Optional[int]): Días por año para anualizar; None para no anualizar.
+
+    Returns:
+    pd.DataFrame: La desviación estándar móvil, anualizada si corresponde.
+    """
+    volatility = returns.rolling(window).std()
+    if annualization is not None:
+        volatility *= np.sqrt(annualization)
+    return volatility
+
+
+def nav(returns: pd.DataFrame, base: float = 100.0) -> pd.DataFrame:
+    """
+    Reconstruye una serie de valor cuota partiendo de `base` a partir de los retornos diarios.
+
+    Returns:
+    pd.DataFrame: El valor acumulado; los retornos faltantes se tratan como 0.
+    """
+    return base * (1 + returns.fillna(0)).cumprod()
+
+
+def drawdowns(prices: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calcula el drawdown de cada fecha respecto del máximo acumulado.
+
+    Returns:
+    pd.DataFrame: Valores entre -1 y 0, 0 en los máximos.
+    """
+    return prices / prices.cummax() - 1
+
+
+def max_drawdown(prices: pd.DataFrame) -> pd.Series:
+    """
+    Calcula el drawdown máximo de cada activo.
+
+    Returns:
+    pd.Series: El peor drawdown por activo.
+    """
+    return drawdowns(prices).min()
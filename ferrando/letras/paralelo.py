@@ -0,0 +1,183 @@
+"""
+Ejecución en paralelo de normalizaciones de texto y RUT sobre grandes volúmenes de datos.
+
+Divide la entrada (lista, Series o archivo) en trozos y aplica un pipeline de funciones puras, por ejemplo
+remove_dots seguido de is_dv_valid, en un ProcessPoolExecutor. El tamaño de los trozos se ajusta midiendo el
+pipeline sobre una muestra, de modo que cada trozo tome del orden de TARGET_CHUNK_SECONDS y el costo de
+enviar los datos a los procesos quede amortizado. El resultado mantiene siempre el orden de la entrada.
+
+Las funciones del pipeline deben poder serializarse con pickle (definidas a nivel de módulo, no lambdas).
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from os import cpu_count
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+import pandas as pd
+
+Pipeline = Callable[[Any], Any] | Sequence[Callable[[Any], Any]]
+
+# Duración objetivo de cada trozo en un proceso
+TARGET_CHUNK_SECONDS: float = 0.2
+# Elementos que se procesan localmente para medir el pipeline
+SAMPLE_SIZE: int = 1_000
+# Tope del tamaño de un trozo
+MAX_CHUNK_SIZE: int = 1_000_000
+# Trozos mínimos por proceso cuando se conoce el largo de la entrada, para balancear la carga
+CHUNKS_PER_WORKER: int = 4
+
+
+def _as_functions(pipeline: Pipeline) -> tuple[Callable[[Any], Any], ...]:
+    """
+    Normaliza el pipeline a una tupla de funciones.
+    """
+    return (pipeline,) if callable(pipeline) else tuple(pipeline)
+
+
+def _run_chunk(functions: tuple[Callable[[Any], Any], ...], chunk: list) -> list:
+    """
+    Aplica las funciones en orden a todos los elementos del trozo. Se ejecuta en los procesos.
+    """
+    for function in functions:
+        chunk = [function(value) for value in chunk]
+    return chunk
+
+
+def _chunks(values: Iterator, chunk_size: int) -> Iterator[list]:
+    """
+    Agrupa los valores en listas de a lo más chunk_size elementos.
+    """
+    while chunk := list(islice(values, chunk_size)):
+        yield chunk
+
+
+def _parallel_chunks(
+    functions: tuple[Callable[[Any], Any], ...],
+    values: Iterable,
+    total: Optional[int],
+    max_workers: Optional[int],
+    chunk_size: Optional[int],
+) -> Iterator[list]:
+    """
+    Procesa los valores por trozos en un pool de procesos, entregando los resultados en el orden de entrada.
+
+    Si no se indica chunk_size, se procesa localmente una muestra para medir el costo por elemento y se
+    elige el tamaño de trozo a partir de esa medición; los resultados de la muestra se reutilizan.
+    """
+    values = iter(values)
+    workers = max_workers or cpu_count() or 1
+
+    if chunk_size is None:
+        sample = list(islice(values, SAMPLE_SIZE))
+        start = perf_counter()
+        yield _run_chunk(functions, sample)
+        per_item = (perf_counter() - start) / max(len(sample), 1)
+        chunk_size = int(TARGET_CHUNK_SECONDS / per_item) if per_item > 0 else MAX_CHUNK_SIZE
+        if total is not None:
+            remaining = total - len(sample)
+            chunk_size = min(chunk_size, -(-remaining // (workers * CHUNKS_PER_WORKER)))
+        chunk_size = max(1, min(chunk_size, MAX_CHUNK_SIZE))
+    elif chunk_size < 1:
+        raise ValueError("chunk_size debe ser mayor que 0")
+
+    if workers == 1:
+        for chunk in _chunks(values, chunk_size):
+            yield _run_chunk(functions, chunk)
+        return
+
+    # Se limita la cantidad de trozos en vuelo para no cargar toda la entrada en memoria
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in _chunks(values, chunk_size):
+            pending.append(executor.submit(_run_chunk, functions, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def parallel_map(
+    pipeline: Pipeline,
+    data: Iterable | pd.Series,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> list | pd.Series:
+    """
+    Aplica un pipeline de funciones a cada elemento de la entrada usando varios procesos.
+
+    Args:
+    - pipeline (Callable | Sequence[Callable]): Una función o una secuencia de funciones a aplicar en orden.
+    - data (Iterable | pd.Series): Los valores a procesar.
+    - max_workers (Optional[int]): Número de procesos. Por defecto la cantidad de CPUs.
+    - chunk_size (Optional[int]): Elementos por trozo. Por defecto se elige de forma adaptativa.
+
+    Returns:
+    - list | pd.Series: Los resultados en el mismo orden de la entrada; una Series con el mismo índice
+      si la entrada es una Series.
+
+    Example:
+    >>> from ferrando.letras.generales import remove_dots
+    >>> from ferrando.letras.rut import is_dv_valid
+    >>> parallel_map([remove_dots, is_dv_valid], ["9.007.586-1", "12.345.670-K"])
+    [True, True]
+    """
+    functions = _as_functions(pipeline)
+    values = data.tolist() if isinstance(data, pd.Series) else data
+    total = len(values) if hasattr(values, "__len__") else None
+    results = []
+    for chunk in _parallel_chunks(functions, values, total, max_workers, chunk_size):
+        results.extend(chunk)
+    if isinstance(data, pd.Series):
+        return pd.Series(results, index=data.index, name=data.name)
+    return results
+
+
+def parallel_map_file(
+    pipeline: Pipeline,
+    input_path: str | Path,
+    output_path: str | Path,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Aplica un pipeline a cada línea de un archivo y escribe los resultados, una línea por resultado.
+
+    El archivo se lee y escribe por trozos, así la memoria no depende del tamaño del archivo.
+
+    Args:
+    - pipeline (Callable | Sequence[Callable]): Una función o una secuencia de funciones a aplicar en orden.
+    - input_path (str | Path): El archivo de entrada; a cada línea se le quita el salto de línea.
+    - output_path (str | Path): El archivo de salida, en el mismo orden de la entrada.
+    - max_workers (Optional[int]): Número de procesos. Por defecto la cantidad de CPUs.
+    - chunk_size (Optional[int]): Líneas por trozo. Por defecto se elige de forma adaptativa.
+    - encoding (str): La codificación de ambos archivos.
+
+    Returns:
+    - int: El número de líneas procesadas.
+    """
+    functions = _as_functions(pipeline)
+    count = 0
+    with open(input_path, encoding=encoding) as fin, open(
+        output_path, "w", encoding=encoding
+    ) as fout:
+        lines = (line.rstrip("\n") for line in fin)
+        for chunk in _parallel_chunks(functions, lines, None, max_workers, chunk_size):
+            fout.writelines(f"{result}\n" for result in chunk)
+            count += len(chunk)
+    return count
+
+
+if __name__ == "__main__":
+    try:
+        from .generales import remove_dots, remove_extra_spaces
+        from .rut import generate_random_valid_rut, is_dv_valid
+    except ImportError:
+        from generales import remove_dots, remove_extra_spaces
+        from rut import generate_random_valid_rut, is_dv_valid
+
+    ruts = [generate_random_valid_rut() for _ in range(200_000)]
+    print(all(parallel_map([remove_extra_spaces, remove_dots, is_dv_valid], ruts)))
@@ -1,5 +1,8 @@
 import random
-from generales import remove_dots
+try:
+    from .generales import remove_dots
+except ImportError:
+    from generales import remove_dots
 
 def calculate_verification_digit(rut_sin_dv: int) -> str:
     """